@@ -1,8 +1,10 @@
 """
 Database model for Skills/Agent Profiles
 """
-from sqlalchemy import Column, String, TIMESTAMP, Text, ARRAY, Integer
-from sqlalchemy.dialects.postgresql import UUID, JSONB
+from sqlalchemy import Column, String, TIMESTAMP, Text, ARRAY, Integer, Computed, DDL, event
+from sqlalchemy.dialects.postgresql import UUID, TSVECTOR
+from sqlalchemy.orm import deferred
+from pgvector.sqlalchemy import HALFVEC
 from sqlalchemy import text
 from datetime import datetime
 from api.models.context import Base
@@ -27,7 +29,24 @@ class Skill(Base):
     usage_count = Column(Integer, default=0)  # Number of times skill has been activated
     changelog_url = Column(String(500))  # URL to changelog documentation
     install_url = Column(String(500))  # URL for installing/viewing the skill
-    embedding = Column(JSONB)  # Vector embedding for semantic search (1024-dim array)
+    embedding = Column(HALFVEC(1024))  # Vector embedding for semantic search (pgvector halfvec, see migrations 012 and 015)
+    embedding_model_id = Column(String(255))  # Bedrock model that produced the embedding (see migration 016)
+    embedding_input_hash = Column(String(32))  # MD5 of the text that was embedded
+    # MD5 of the current embedding text; differs from embedding_input_hash when stale (see migration 017)
+    embedding_text_hash = deferred(Column(
+        String(32),
+        Computed("md5(skills_embedding_text(title, description, tags))", persisted=True)
+    ))
+    embedding_claimed_at = Column(TIMESTAMP)  # Set while an embedding worker holds the skill (see migration 014)
+    # Full-text search vector over title, description and tags (see migration 011)
+    search_tsv = deferred(Column(
+        TSVECTOR,
+        Computed(
+            "to_tsvector('english', coalesce(title, '') || ' ' || "
+            "coalesce(description, '') || ' ' || skills_tags_text(tags))",
+            persisted=True
+        )
+    ))
     created_at = Column(TIMESTAMP, default=datetime.utcnow, index=True)
     updated_at = Column(TIMESTAMP, default=datetime.utcnow, onupdate=datetime.utcnow)
 
@@ -52,3 +71,32 @@ class Skill(Base):
             "createdAt": self.created_at.isoformat() if self.created_at else None,
             "updatedAt": self.updated_at.isoformat() if self.updated_at else None
         }
+
+
+# pgvector extension for the embedding column
+event.listen(
+    Skill.__table__,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS vector")
+)
+
+# Immutable helper used by the search_tsv generated column
+event.listen(
+    Skill.__table__,
+    "before_create",
+    DDL(
+        "CREATE OR REPLACE FUNCTION skills_tags_text(tags TEXT[]) RETURNS TEXT "
+        "LANGUAGE sql IMMUTABLE AS $$ SELECT array_to_string(COALESCE(tags, '{}'), ' ') $$"
+    )
+)
+
+# Immutable helper used by the embedding_text_hash generated column
+event.listen(
+    Skill.__table__,
+    "before_create",
+    DDL(
+        "CREATE OR REPLACE FUNCTION skills_embedding_text(title TEXT, description TEXT, tags TEXT[]) "
+        "RETURNS TEXT LANGUAGE sql IMMUTABLE AS $$ SELECT concat_ws(' ', title, nullif(description, ''), "
+        "nullif(array_to_string(tags, ' '), '')) $$"
+    )
+)
@@ -10,6 +10,9 @@ from config.database import get_db
 
 router = APIRouter(prefix="/api", tags=["Context API"])
 
+# Largest batch accepted by POST /api/contexts/bulk
+MAX_BULK_CONTEXTS = 500
+
 
 @router.post(
     "/context",
@@ -173,6 +176,64 @@ async def store_context(
         )
 
 
+@router.post(
+    "/contexts/bulk",
+    response_model=dict,
+    status_code=status.HTTP_201_CREATED,
+    responses={
+        201: {"description": "Contexts successfully stored"},
+        400: {"model": ErrorResponse, "description": "Bad request"},
+        500: {"model": ErrorResponse, "description": "Internal server error"}
+    }
+)
+def store_contexts_bulk(
+    contexts: List[ContextRequest],
+    db: Session = Depends(get_db)
+):
+    """
+    Store many workflow contexts in a single request
+
+    Accepts an array of up to 500 context objects (same shape as `POST /api/context`)
+    and inserts them in one batch. Declared as a plain `def` so FastAPI runs the
+    blocking database writes in its threadpool instead of on the event loop.
+
+    **Response:**
+    - status: Operation status
+    - count: Number of contexts stored
+    - contextIds: Generated context IDs, in request order
+    """
+    if len(contexts) > MAX_BULK_CONTEXTS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={
+                "status": "error",
+                "error": "ValidationError",
+                "details": f"At most {MAX_BULK_CONTEXTS} contexts can be stored per request (got {len(contexts)})"
+            }
+        )
+
+    try:
+        service = ContextService(db)
+        context_ids = service.store_contexts_bulk(contexts)
+
+        return {
+            "status": "success",
+            "count": len(context_ids),
+            "contextIds": context_ids
+        }
+
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={"status": "error", "error": "ValidationError", "details": str(e)}
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={"status": "error", "error": "InternalServerError", "details": str(e)}
+        )
+
+
 @router.get(
     "/context/{context_id}",
     response_model=dict,
@@ -2,6 +2,7 @@
 FastAPI routes for Skills API (Context Artifact Type 1: Agent Profile Documents)
 """
 from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.orm import Session
 from typing import Optional
 from api.schemas.skill_schema import (
@@ -26,10 +27,13 @@ router = APIRouter(prefix="/api/skills", tags=["Skills API"])
         500: {"description": "Ingestion failed"}
     }
 )
-async def ingest_local_skills(db: Session = Depends(get_db)):
+def ingest_local_skills(db: Session = Depends(get_db)):
     """
     Ingest skills from local skills directory
 
+    Declared as a plain `def` so FastAPI runs the blocking file reads and
+    database writes in its threadpool instead of on the event loop.
+
     This endpoint:
     - Reads skill markdown files from the skills/ directory
     - Parses markdown content to extract title, description, category, tags
@@ -63,9 +67,9 @@ async def ingest_local_skills(db: Session = Depends(get_db)):
 
 @router.get(
     "",
-    response_model=SkillSearchResponse,
+    response_model=None,
     responses={
-        200: {"description": "Skills retrieved successfully"}
+        200: {"model": SkillSearchResponse, "description": "Skills retrieved successfully"}
     }
 )
 async def get_all_skills(
@@ -90,12 +94,14 @@ async def get_all_skills(
         service = SkillService(db)
         skills = service.get_all_skills(limit=limit)
 
-        return SkillSearchResponse(
-            status="success",
-            count=len(skills),
-            filters={},
-            data=skills
-        )
+        # Rows are already shaped as SkillResponse JSON by the query, so skip
+        # response-model validation and serialize them directly
+        return ORJSONResponse({
+            "status": "success",
+            "count": len(skills),
+            "filters": {},
+            "data": skills
+        })
 
     except Exception as e:
         raise HTTPException(
@@ -109,9 +115,9 @@ async def get_all_skills(
 
 @router.get(
     "/search",
-    response_model=SkillSearchResponse,
+    response_model=None,
     responses={
-        200: {"description": "Search results retrieved successfully"}
+        200: {"model": SkillSearchResponse, "description": "Search results retrieved successfully"}
     }
 )
 async def search_skills(
@@ -156,16 +162,16 @@ async def search_skills(
             limit=limit
         )
 
-        return SkillSearchResponse(
-            status="success",
-            count=len(results),
-            filters={
+        return ORJSONResponse({
+            "status": "success",
+            "count": len(results),
+            "filters": {
                 "query": query,
                 "category": category,
                 "tag": tag
             },
-            data=results
-        )
+            "data": results
+        })
 
     except Exception as e:
         raise HTTPException(
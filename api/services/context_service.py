@@ -1,14 +1,20 @@
 """
 Business logic for Context API
 """
-import uuid
+import re
+import secrets
 from datetime import datetime
 from typing import Optional, Dict, Any
+from sqlalchemy import insert, or_
 from sqlalchemy.orm import Session
 from api.models.context import UserContext, ContextAnalytics
 from api.schemas.context_schema import ContextRequest, ContextResponse
 
 
+# Format produced by ContextService.generate_context_id
+_CONTEXT_ID_RE = re.compile(r'ctx_[0-9a-f]{12}')
+
+
 class ContextService:
     """Service for handling workflow context operations"""
 
@@ -17,41 +23,19 @@ class ContextService:
 
     def generate_context_id(self) -> str:
         """Generate a unique context ID"""
-        return f"ctx_{uuid.uuid4().hex[:12]}"
+        return f"ctx_{secrets.token_hex(6)}"
 
     def store_context(self, context_data: ContextRequest) -> ContextResponse:
         """Store workflow context data (per ContextPLTC spec)"""
         try:
-            # Generate unique context ID
-            context_id = self.generate_context_id()
-
-            # Prepare context_data JSONB
-            context_json = {
-                "repoID": context_data.repoID,
-                "catalogID": context_data.catalogID,
-                "ticketID": context_data.ticketID,
-                "contextLevel": context_data.contextLevel,
-                "AI_Client_type": context_data.AI_Client_type,
-                "details": context_data.details,
-                "files": context_data.files or [],
-                "conversationHistory": context_data.conversationHistory or [],
-                "status": context_data.status or "in_progress",
-                "blockedBy": context_data.blockedBy
-            }
+            # Build the user_contexts row (context_id + context_data JSONB)
+            row = self._build_context_row(context_data)
 
-            # Create context record
-            user_context = UserContext(
-                context_id=context_id,
-                user_id=context_data.userId,
-                session_id=context_data.sessionId,
-                context_data=context_json,
-                timestamp=context_data.timestamp
-            )
-
-            # Save to database
-            self.db.add(user_context)
+            # Save to database (Core insert, no ORM unit-of-work overhead)
+            context_id = self.db.execute(
+                insert(UserContext).values(**row).returning(UserContext.context_id)
+            ).scalar_one()
             self.db.commit()
-            self.db.refresh(user_context)
 
             # Generate response per ContextPLTC spec
             details = f"Context captured for ticket {context_data.ticketID} in repo {context_data.repoID}"
@@ -90,6 +74,62 @@ class ContextService:
             self.db.rollback()
             raise e
 
+    def store_contexts_bulk(self, contexts: list[ContextRequest]) -> list[str]:
+        """
+        Store many workflow contexts in one executemany insert
+
+        Returns the generated context IDs in request order
+        """
+        if not contexts:
+            return []
+
+        try:
+            rows = [self._build_context_row(context_data) for context_data in contexts]
+
+            self.db.execute(insert(UserContext), rows)
+            self.db.commit()
+
+            self._log_analytics_events([
+                {
+                    "context_id": row["context_id"],
+                    "event_type": "context_stored",
+                    "event_data": {
+                        "user_id": context_data.userId,
+                        "repo_id": context_data.repoID,
+                        "ticket_id": context_data.ticketID,
+                        "context_level": context_data.contextLevel
+                    }
+                }
+                for row, context_data in zip(rows, contexts)
+            ])
+
+            return [row["context_id"] for row in rows]
+
+        except Exception as e:
+            self.db.rollback()
+            raise e
+
+    def _build_context_row(self, context_data: ContextRequest) -> Dict[str, Any]:
+        """Build a user_contexts row from a context request"""
+        return {
+            "context_id": self.generate_context_id(),
+            "user_id": context_data.userId,
+            "session_id": context_data.sessionId,
+            "context_data": {
+                "repoID": context_data.repoID,
+                "catalogID": context_data.catalogID,
+                "ticketID": context_data.ticketID,
+                "contextLevel": context_data.contextLevel,
+                "AI_Client_type": context_data.AI_Client_type,
+                "details": context_data.details,
+                "files": context_data.files or [],
+                "conversationHistory": context_data.conversationHistory or [],
+                "status": context_data.status or "in_progress",
+                "blockedBy": context_data.blockedBy
+            },
+            "timestamp": context_data.timestamp
+        }
+
     def get_context(self, context_id: str) -> Optional[Dict[str, Any]]:
         """Retrieve context by ID"""
         context = self.db.query(UserContext).filter(
@@ -123,6 +163,16 @@ class ContextService:
             self.db.rollback()
             print(f"Analytics logging failed: {e}")
 
+    def _log_analytics_events(self, events: list[Dict[str, Any]]):
+        """Log several analytics events in one executemany insert"""
+        try:
+            self.db.execute(insert(ContextAnalytics), events)
+            self.db.commit()
+        except Exception as e:
+            # Don't fail the main operation if analytics logging fails
+            self.db.rollback()
+            print(f"Analytics logging failed: {e}")
+
     # ============ CONTEXT DISCOVERY METHODS ============
 
     def search_contexts(
@@ -175,11 +225,13 @@ class ContextService:
                 UserContext.context_data['status'].astext == status
             )
 
-        # Text search in details field
+        # Text search in details field; a query that is a context ID also
+        # matches that context itself (alongside contexts that mention it)
         if query_text:
-            query = query.filter(
-                UserContext.context_data['details'].astext.ilike(f'%{query_text}%')
-            )
+            details_match = UserContext.context_data['details'].astext.ilike(f'%{query_text}%')
+            if _CONTEXT_ID_RE.fullmatch(query_text):
+                details_match = or_(UserContext.context_id == query_text, details_match)
+            query = query.filter(details_match)
 
         # Order by most recent and limit results
         contexts = query.order_by(
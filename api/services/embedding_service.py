@@ -3,30 +3,129 @@ Service for generating embeddings using AWS Bedrock Titan
 """
 import boto3
 import json
-import numpy as np
+import threading
+import time
+from botocore.config import Config
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import List, Optional
+from sqlalchemy.orm import Session
+from api.models.skill import Skill
+from config.settings import settings
 import logging
 
 logger = logging.getLogger(__name__)
 
 
+# Request path (API): fail fast; a slow embedding call falls back to keyword matching
+_REQUEST_CLIENT_CONFIG = Config(max_pool_connections=50, retries={'max_attempts': 2})
+
+# Batch path (embedding script): pool sized for the worker threads; adaptive retries
+# back off on throttling instead of failing skills
+_BATCH_CLIENT_CONFIG = Config(
+    max_pool_connections=64,
+    tcp_keepalive=True,
+    retries={'mode': 'adaptive', 'max_attempts': 10}
+)
+
+
+@lru_cache(maxsize=8)
+def _get_bedrock_client(region_name: str, batch: bool = False):
+    """
+    Get the Bedrock runtime client for a region
+
+    Created once per region (and path) and shared by every EmbeddingService, so
+    credential resolution and the HTTPS connection pool are reused across requests.
+    """
+    client = boto3.client(
+        'bedrock-runtime',
+        region_name=region_name,
+        config=_BATCH_CLIENT_CONFIG if batch else _REQUEST_CLIENT_CONFIG
+    )
+    logger.info(f"Bedrock runtime client initialized for region: {region_name}")
+    return client
+
+
+class TokenBucket:
+    """Thread-safe token bucket that paces requests to a steady rate with bursts"""
+
+    def __init__(self, rate_per_second: float, capacity: int):
+        """
+        Args:
+            rate_per_second: Tokens added per second (sustained request rate)
+            capacity: Maximum tokens held (largest burst)
+        """
+        if rate_per_second <= 0:
+            raise ValueError(f"rate_per_second must be positive, got {rate_per_second}")
+        self.rate = rate_per_second
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Take one token, blocking until one is available"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+
+                wait = (1 - self._tokens) / self.rate
+
+            time.sleep(wait)
+
+
+# Paces the batch path (generate_skill_embeddings_batch) across all worker threads so
+# they stay under the account's Bedrock quota. It blocks, so it is never used on the
+# API request path, which runs on the event loop.
+_rate_limiter = TokenBucket(
+    rate_per_second=settings.BEDROCK_MAX_REQUESTS_PER_MINUTE / 60,
+    capacity=max(1, settings.BEDROCK_MAX_REQUESTS_PER_MINUTE // 60)
+)
+
+
+def build_skill_text(skill_title: str, skill_description: Optional[str], skill_tags: Optional[List[str]]) -> str:
+    """
+    Combine skill metadata into the single text that gets embedded
+
+    Args:
+        skill_title: Skill title
+        skill_description: Skill description
+        skill_tags: List of skill tags
+
+    Returns:
+        Title, description and tags joined with spaces
+    """
+    text_parts = [skill_title]
+
+    if skill_description:
+        text_parts.append(skill_description)
+
+    if skill_tags:
+        text_parts.append(" ".join(skill_tags))
+
+    return " ".join(text_parts)
+
+
 class EmbeddingService:
     """Service for generating text embeddings using AWS Bedrock Titan"""
 
-    def __init__(self, region_name: str = 'us-east-1'):
+    def __init__(self, region_name: str = 'us-east-1', batch: bool = False):
         """
         Initialize Bedrock client
 
         Args:
             region_name: AWS region for Bedrock service
+            batch: Use the bulk-generation client (more retries) instead of the request one
         """
+        self.model_id = 'amazon.titan-embed-text-v2:0'
         try:
-            self.bedrock_runtime = boto3.client(
-                'bedrock-runtime',
-                region_name=region_name
-            )
-            self.model_id = 'amazon.titan-embed-text-v2:0'
-            logger.info(f"Bedrock Embedding Service initialized with model: {self.model_id}")
+            self.bedrock_runtime = _get_bedrock_client(region_name, batch)
         except Exception as e:
             logger.error(f"Failed to initialize Bedrock client: {e}")
             self.bedrock_runtime = None
@@ -47,9 +146,12 @@ class EmbeddingService:
             return None
 
         try:
-            # Prepare request body
+            # Prepare request body (Titan returns unit-length vectors, so cosine
+            # distance needs no client-side normalization)
             request_body = {
-                "inputText": text
+                "inputText": text,
+                "dimensions": 1024,
+                "normalize": True
             }
 
             # Invoke Bedrock model
@@ -63,7 +165,7 @@ class EmbeddingService:
             embedding = response_body.get('embedding')
 
             if embedding:
-                logger.debug(f"Generated embedding of dimension: {len(embedding)}")
+                logger.debug("Generated embedding of dimension: %d", len(embedding))
                 return embedding
             else:
                 logger.error("No embedding in response")
@@ -85,68 +187,52 @@ class EmbeddingService:
         Returns:
             Embedding vector or None if generation fails
         """
-        # Combine skill metadata into a single text for embedding
-        text_parts = [skill_title]
-
-        if skill_description:
-            text_parts.append(skill_description)
-
-        if skill_tags:
-            text_parts.append(" ".join(skill_tags))
-
-        combined_text = " ".join(text_parts)
+        return self.generate_embedding(build_skill_text(skill_title, skill_description, skill_tags))
 
-        return self.generate_embedding(combined_text)
-
-    @staticmethod
-    def cosine_similarity(embedding1: List[float], embedding2: List[float]) -> float:
+    def generate_skill_embeddings_batch(self, texts: List[str], max_workers: int = 32) -> List[Optional[List[float]]]:
         """
-        Calculate cosine similarity between two embedding vectors
+        Generate embeddings for a batch of texts
+
+        Titan Text Embeddings v2 accepts a single inputText per InvokeModel call,
+        so the batch is fanned out over a thread pool sharing the Bedrock client.
+        Calls are paced by the shared token bucket (blocking; not for the event loop).
 
         Args:
-            embedding1: First embedding vector
-            embedding2: Second embedding vector
+            texts: Input texts to embed (e.g. from build_skill_text)
+            max_workers: Maximum concurrent Bedrock requests
 
         Returns:
-            Cosine similarity score between -1 and 1
+            Embedding vectors in the same order as texts (None where generation failed)
         """
-        try:
-            vec1 = np.array(embedding1)
-            vec2 = np.array(embedding2)
+        if not texts:
+            return []
 
-            dot_product = np.dot(vec1, vec2)
-            norm1 = np.linalg.norm(vec1)
-            norm2 = np.linalg.norm(vec2)
+        def paced_embedding(text: str) -> Optional[List[float]]:
+            _rate_limiter.acquire()
+            return self.generate_embedding(text)
 
-            if norm1 == 0 or norm2 == 0:
-                return 0.0
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(texts))) as executor:
+            return list(executor.map(paced_embedding, texts))
 
-            similarity = dot_product / (norm1 * norm2)
-            return float(similarity)
-
-        except Exception as e:
-            logger.error(f"Error calculating cosine similarity: {e}")
-            return 0.0
-
-    def find_most_similar(self, query_embedding: List[float], skill_embeddings: List[tuple]) -> List[tuple]:
+    def find_most_similar(self, db: Session, query_embedding: List[float], limit: int = 3) -> List[tuple]:
         """
         Find most similar skills based on embedding similarity
 
+        Runs as a single pgvector query (ORDER BY cosine distance LIMIT k), served
+        by the HNSW index on skills.embedding.
+
         Args:
+            db: Database session
             query_embedding: Query embedding vector
-            skill_embeddings: List of (skill, embedding) tuples
+            limit: Maximum number of skills to return
 
         Returns:
             List of (skill, similarity_score) tuples sorted by similarity descending
         """
-        results = []
-
-        for skill, embedding in skill_embeddings:
-            if embedding:
-                similarity = self.cosine_similarity(query_embedding, embedding)
-                results.append((skill, similarity))
+        distance = Skill.embedding.cosine_distance(query_embedding)
 
-        # Sort by similarity descending
-        results.sort(key=lambda x: x[1], reverse=True)
+        rows = db.query(Skill, distance.label('distance')).filter(
+            Skill.embedding.isnot(None)
+        ).order_by(distance).limit(limit).all()
 
-        return results
+        return [(skill, 1 - distance) for skill, distance in rows]
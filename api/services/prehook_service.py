@@ -3,11 +3,15 @@ Service for Context Plane Pre-Hook endpoints
 Handles skill updates, suggestions, and sharing
 """
 from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy import Text, cast, func, select
+from sqlalchemy.dialects.postgresql import TSQUERY
 from api.models.skill import Skill
 from api.models.user_skill import UserSkill
 from api.services.embedding_service import EmbeddingService
+from api.services.skill_catalog_cache import get_cached_skills, set_cached_skills, invalidate_skills_cache
 from datetime import datetime
+from functools import lru_cache
+from packaging.version import Version, InvalidVersion
 from typing import List, Dict, Optional
 import re
 import logging
@@ -18,6 +22,32 @@ from pathlib import Path
 logger = logging.getLogger(__name__)
 
 
+# Full-text candidates scored by keyword confidence in the fallback (top 3 are returned)
+KEYWORD_CANDIDATE_LIMIT = 50
+
+
+# Word tokenizer used for keyword matching
+_WORD_RE = re.compile(r'\w+')
+
+# Shape of a skill ID (e.g. "doc-coauthoring", "lucky-number")
+_SKILL_ID_RE = re.compile(r'[a-z0-9]+(?:-[a-z0-9]+)*')
+
+
+@lru_cache(maxsize=4096)
+def _tokenize(text: str) -> frozenset:
+    """Lower-cased word set for a skill text; skills repeat across requests, so memoize"""
+    return frozenset(_WORD_RE.findall(text.lower()))
+
+
+@lru_cache(maxsize=1024)
+def _parse_version(version: str) -> Optional[Version]:
+    """Parse a version string once; returns None if it is malformed"""
+    try:
+        return Version(version)
+    except (InvalidVersion, TypeError):
+        return None
+
+
 class PreHookService:
     """Service for pre-hook operations"""
 
@@ -42,61 +72,61 @@ class PreHookService:
         installed_map = {skill['skill_id']: skill['version'] for skill in installed_skills}
 
         # Get all available skills
-        all_skills = self.db.query(Skill).all()
+        all_skills = self._load_all_skills()
 
         available_updates = []
         new_skills = []
 
         for skill in all_skills:
             # Use flexible matching to find installed version
-            current_version = self._find_installed_version(skill.skill_id, installed_map)
+            current_version = self._find_installed_version(skill['skill_id'], installed_map)
 
             if current_version is not None:
                 # Check if there's an update
-                if self._compare_versions(skill.version, current_version) > 0:
+                if self._compare_versions(skill['version'], current_version) > 0:
                     available_updates.append({
-                        "skillId": skill.skill_id,
-                        "name": skill.title,
+                        "skillId": skill['skill_id'],
+                        "name": skill['title'],
                         "currentVersion": current_version,
-                        "latestVersion": skill.version,
-                        "category": skill.category or "general",
-                        "description": skill.description or "",
-                        "changelogUrl": skill.changelog_url,
-                        "installUrl": skill.install_url,
-                        "usageCount": skill.usage_count or 0,
-                        "maintainer": skill.maintainer or "unknown"
+                        "latestVersion": skill['version'],
+                        "category": skill['category'] or "general",
+                        "description": skill['description'] or "",
+                        "changelogUrl": skill['changelog_url'],
+                        "installUrl": skill['install_url'],
+                        "usageCount": skill['usage_count'] or 0,
+                        "maintainer": skill['maintainer'] or "unknown"
                     })
             else:
                 # This is a new skill the user doesn't have
                 # Check if skill was created after last_check
                 try:
                     last_check_dt = datetime.fromisoformat(last_check.replace('Z', '+00:00'))
-                    if skill.created_at and skill.created_at > last_check_dt:
+                    if skill['created_at'] and skill['created_at'] > last_check_dt:
                         new_skills.append({
-                            "skillId": skill.skill_id,
-                            "name": skill.title,
+                            "skillId": skill['skill_id'],
+                            "name": skill['title'],
                             "currentVersion": "0.0.0",
-                            "latestVersion": skill.version,
-                            "category": skill.category or "general",
-                            "description": skill.description or "",
-                            "changelogUrl": skill.changelog_url,
-                            "installUrl": skill.install_url,
-                            "usageCount": skill.usage_count or 0,
-                            "maintainer": skill.maintainer or "unknown"
+                            "latestVersion": skill['version'],
+                            "category": skill['category'] or "general",
+                            "description": skill['description'] or "",
+                            "changelogUrl": skill['changelog_url'],
+                            "installUrl": skill['install_url'],
+                            "usageCount": skill['usage_count'] or 0,
+                            "maintainer": skill['maintainer'] or "unknown"
                         })
                 except Exception:
                     # If date parsing fails, include as new skill
                     new_skills.append({
-                        "skillId": skill.skill_id,
-                        "name": skill.title,
+                        "skillId": skill['skill_id'],
+                        "name": skill['title'],
                         "currentVersion": "0.0.0",
-                        "latestVersion": skill.version,
-                        "category": skill.category or "general",
-                        "description": skill.description or "",
-                        "changelogUrl": skill.changelog_url,
-                        "installUrl": skill.install_url,
-                        "usageCount": skill.usage_count or 0,
-                        "maintainer": skill.maintainer or "unknown"
+                        "latestVersion": skill['version'],
+                        "category": skill['category'] or "general",
+                        "description": skill['description'] or "",
+                        "changelogUrl": skill['changelog_url'],
+                        "installUrl": skill['install_url'],
+                        "usageCount": skill['usage_count'] or 0,
+                        "maintainer": skill['maintainer'] or "unknown"
                     })
 
         return {
@@ -115,8 +145,25 @@ class PreHookService:
         Returns:
             Dict with suggestions list
         """
-        # Get all skills
-        all_skills = self.db.query(Skill).all()
+        # A prompt that is just a skill ID resolves directly to that skill
+        prompt_id = user_prompt.strip()
+        if _SKILL_ID_RE.fullmatch(prompt_id):
+            skill = self.db.query(Skill).filter(Skill.skill_id == prompt_id).first()
+            if skill:
+                return {
+                    "suggestions": [{
+                        "skillId": skill.skill_id,
+                        "confidence": 1.0,
+                        "reasoning": "User prompt matches this skill ID",
+                        "skillMetadata": {
+                            "name": skill.title,
+                            "description": skill.description or "",
+                            "category": skill.category or "general",
+                            "capabilities": skill.tags or []
+                        },
+                        "installed": self._is_skill_installed(skill.skill_id)
+                    }]
+                }
 
         # Try semantic search first (v2)
         try:
@@ -126,23 +173,17 @@ class PreHookService:
             query_embedding = self.embedding_service.generate_embedding(user_prompt)
 
             if query_embedding:
-                # Filter skills that have embeddings
-                skills_with_embeddings = [
-                    (skill, skill.embedding)
-                    for skill in all_skills
-                    if skill.embedding
-                ]
-
-                if skills_with_embeddings:
-                    # Calculate similarities
-                    results = self.embedding_service.find_most_similar(
-                        query_embedding,
-                        skills_with_embeddings
-                    )
-
+                # Nearest skills by cosine distance, computed in PostgreSQL
+                results = self.embedding_service.find_most_similar(
+                    self.db,
+                    query_embedding,
+                    limit=3
+                )
+
+                if results:
                     # Convert to suggestions format
                     suggestions = []
-                    for skill, similarity in results[:3]:  # Top 3
+                    for skill, similarity in results:
                         if similarity > 0.5:  # Threshold for semantic similarity
                             suggestions.append({
                                 "skillId": skill.skill_id,
@@ -162,17 +203,42 @@ class PreHookService:
                         return {"suggestions": suggestions}
 
         except Exception as e:
+            # Clear any failed transaction before the keyword query
+            self.db.rollback()
             logger.warning(f"Semantic search failed, falling back to keyword matching: {e}")
 
         # Fallback to keyword matching (v1)
         logger.info("Using keyword matching (v1) as fallback")
         suggestions = []
 
+        # Let PostgreSQL rank skills by full-text match (GIN index on search_tsv).
+        # plainto_tsquery ANDs the prompt's lexemes; OR them so a skill matching
+        # any word is a candidate, as with the word-overlap scoring below
+        ts_query = cast(
+            func.replace(cast(func.plainto_tsquery('english', user_prompt), Text), ' & ', ' | '),
+            TSQUERY
+        )
+        rank = func.ts_rank(Skill.search_tsv, ts_query).label('rank')
+        # Only the columns used for scoring; content and embedding stay in the database
+        ranked_skills = self.db.execute(
+            select(
+                Skill.skill_id,
+                Skill.title,
+                Skill.description,
+                Skill.category,
+                Skill.tags,
+                rank
+            )
+            .where(Skill.search_tsv.op('@@')(ts_query))
+            .order_by(rank.desc())
+            .limit(KEYWORD_CANDIDATE_LIMIT)
+        ).all()
+
         # Extract keywords from prompt
         prompt_lower = user_prompt.lower()
-        prompt_keywords = set(re.findall(r'\w+', prompt_lower))
+        prompt_keywords = set(_WORD_RE.findall(prompt_lower))
 
-        for skill in all_skills:
+        for skill in ranked_skills:
             confidence = self._calculate_keyword_confidence(
                 prompt_keywords,
                 skill
@@ -261,6 +327,7 @@ class PreHookService:
             self.db.add(new_skill)
 
         self.db.commit()
+        invalidate_skills_cache()
 
         # Calculate notified users (mock for demo)
         notified_count = 0
@@ -357,35 +424,55 @@ class PreHookService:
                 "message": f"Failed to install skill: {str(e)}"
             }
 
+    def _load_all_skills(self) -> List[Dict]:
+        """
+        Load the skills catalog as plain dicts, cached in-process
+
+        The catalog is read on every pre-hook call but only changes on ingestion
+        or sharing, so it is reloaded at most once per skill_catalog_cache TTL.
+        Ingestion and sharing invalidate it in the process that made the change;
+        other worker processes see the change once their TTL expires.
+        Plain dicts are cached rather than ORM objects so they are not tied to
+        the request's session.
+        """
+        cached = get_cached_skills()
+        if cached is not None:
+            return cached
+
+        rows = self.db.query(
+            Skill.skill_id,
+            Skill.title,
+            Skill.description,
+            Skill.category,
+            Skill.tags,
+            Skill.version,
+            Skill.maintainer,
+            Skill.usage_count,
+            Skill.changelog_url,
+            Skill.install_url,
+            Skill.created_at
+        ).all()
+
+        skills = [row._asdict() for row in rows]
+        set_cached_skills(skills)
+        return skills
+
     def _compare_versions(self, version1: str, version2: str) -> int:
         """
         Compare two semantic versions
         Returns: 1 if version1 > version2, -1 if version1 < version2, 0 if equal
         """
-        try:
-            v1_parts = [int(x) for x in version1.split('.')]
-            v2_parts = [int(x) for x in version2.split('.')]
-
-            # Pad shorter version with zeros
-            while len(v1_parts) < len(v2_parts):
-                v1_parts.append(0)
-            while len(v2_parts) < len(v1_parts):
-                v2_parts.append(0)
-
-            for i in range(len(v1_parts)):
-                if v1_parts[i] > v2_parts[i]:
-                    return 1
-                elif v1_parts[i] < v2_parts[i]:
-                    return -1
+        v1 = _parse_version(version1)
+        v2 = _parse_version(version2)
 
+        if v1 is None or v2 is None:
             return 0
-        except Exception:
-            return 0
+
+        return (v1 > v2) - (v1 < v2)
 
     def _calculate_keyword_confidence(self, prompt_keywords: set, skill: Skill) -> float:
         """Calculate confidence score based on keyword matching"""
-        skill_text = f"{skill.title} {skill.description or ''} {' '.join(skill.tags or [])}".lower()
-        skill_keywords = set(re.findall(r'\w+', skill_text))
+        skill_keywords = _tokenize(f"{skill.title} {skill.description or ''} {' '.join(skill.tags or [])}")
 
         # Calculate overlap
         common_keywords = prompt_keywords.intersection(skill_keywords)
@@ -397,23 +484,20 @@ class PreHookService:
         overlap_score = len(common_keywords) / len(prompt_keywords)
 
         # Boost if title matches
-        title_keywords = set(re.findall(r'\w+', skill.title.lower()))
-        title_overlap = len(prompt_keywords.intersection(title_keywords))
+        title_overlap = len(prompt_keywords.intersection(_tokenize(skill.title)))
         if title_overlap > 0:
             overlap_score += 0.2
 
         # Boost if category matches
         if skill.category:
-            category_keywords = set(re.findall(r'\w+', skill.category.lower()))
-            if prompt_keywords.intersection(category_keywords):
+            if prompt_keywords.intersection(_tokenize(skill.category)):
                 overlap_score += 0.1
 
         return min(overlap_score, 1.0)
 
     def _generate_reasoning(self, prompt_keywords: set, skill: Skill) -> str:
         """Generate human-readable reasoning for the suggestion"""
-        skill_text = f"{skill.title} {skill.description or ''}".lower()
-        skill_keywords = set(re.findall(r'\w+', skill_text))
+        skill_keywords = _tokenize(f"{skill.title} {skill.description or ''}")
 
         common_keywords = prompt_keywords.intersection(skill_keywords)
 
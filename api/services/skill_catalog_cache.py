@@ -0,0 +1,36 @@
+"""
+Process-wide cache of the skills catalog
+
+Read by the pre-hook service on every call; invalidated by whichever service
+changes the skills table (ingestion, manual upload, sharing).
+"""
+import time
+from typing import List, Dict, Optional, Tuple
+
+
+# How long the in-process skills catalog stays fresh before it is reloaded
+SKILLS_CACHE_TTL_SECONDS = 60
+
+# (loaded_at, list of skill dicts); services are created per request, so the
+# cache lives at module level
+_skills_cache: Optional[Tuple[float, List[Dict]]] = None
+
+
+def get_cached_skills() -> Optional[List[Dict]]:
+    """Return the cached catalog, or None if it is missing or older than the TTL"""
+    cached = _skills_cache
+    if cached and time.monotonic() - cached[0] < SKILLS_CACHE_TTL_SECONDS:
+        return cached[1]
+    return None
+
+
+def set_cached_skills(skills: List[Dict]):
+    """Store a freshly loaded catalog"""
+    global _skills_cache
+    _skills_cache = (time.monotonic(), skills)
+
+
+def invalidate_skills_cache():
+    """Drop the cached skills catalog so the next read hits the database"""
+    global _skills_cache
+    _skills_cache = None
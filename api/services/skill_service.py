@@ -2,17 +2,95 @@
 Business logic for Skills API (Context Artifact Type 1: Agent Profile Documents)
 """
 import os
+import re
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Set, Tuple
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
 from api.models.skill import Skill
 from api.schemas.skill_schema import SkillIngestionRequest, IngestionResponse
+from api.services.skill_catalog_cache import invalidate_skills_cache
+
+
+# Categories for the bundled skills; anything else is categorized by name/content
+SKILL_CATEGORY = {
+    'doc-coauthoring': 'documentation',
+    'docx': 'file-processing',
+    'frontend-design': 'design',
+    'mcp-builder': 'development',
+    'pdf': 'file-processing',
+    'skill-creator': 'development',
+    'web-artifacts-builder': 'web-development',
+    'webapp-testing': 'testing',
+    'xlsx': 'file-processing',
+    'internal-comms': 'communication',
+    'pptx': 'file-processing',
+}
+
+# Content keywords that become tags when found in a skill
+TAG_KEYWORDS = ('documentation', 'testing', 'design', 'frontend', 'backend',
+                'api', 'database', 'deployment', 'CI/CD', 'security', 'performance')
+
+# Every keyword looked up in skill content (tags plus category-only keywords)
+CONTENT_KEYWORDS = frozenset(TAG_KEYWORDS) | {'communication'}
+
+# First "# " heading line
+_TITLE_RE = re.compile(r'^# (.*)$', re.M)
+
+# First non-blank line that is not a heading
+_DESCRIPTION_RE = re.compile(r'^(?!#)[^\S\n]*(\S.*)$', re.M)
+
+
+def _isoformat(column):
+    """
+    SQL expression rendering a TIMESTAMP the way datetime.isoformat() does
+
+    PostgreSQL's own JSON timestamp format trims trailing fractional zeros;
+    isoformat() keeps all six digits and omits the fraction only when it is
+    zero. NULL stays NULL.
+    """
+    return func.regexp_replace(
+        func.to_char(column, 'YYYY-MM-DD"T"HH24:MI:SS.US'), r'\.000000$', ''
+    )
+
+
+def _skill_json():
+    """
+    SQL expression building a skill's API representation (the SkillResponse fields)
+
+    Lets PostgreSQL emit each row as a single JSON object instead of loading ORM
+    instances and serializing them in Python. NULL columns fall back to the
+    SkillResponse defaults, matching what the response model used to produce.
+    """
+    return func.jsonb_build_object(
+        'skillId', Skill.skill_id,
+        'title', Skill.title,
+        'description', Skill.description,
+        'content', Skill.content,
+        'category', Skill.category,
+        'tags', func.coalesce(func.to_jsonb(Skill.tags), func.jsonb_build_array()),
+        'source', func.coalesce(Skill.source, 'anthropic'),
+        'sourceUrl', Skill.source_url,
+        'version', func.coalesce(Skill.version, '1.0.0'),
+        'visibilityScope', func.coalesce(Skill.visibility_scope, 'organization'),
+        'maintainer', Skill.maintainer,
+        'usageCount', func.coalesce(Skill.usage_count, 0),
+        'changelogUrl', Skill.changelog_url,
+        'installUrl', Skill.install_url,
+        'createdAt', _isoformat(Skill.created_at),
+        'updatedAt', _isoformat(Skill.updated_at)
+    )
 
 
 class SkillService:
     """Service for handling skills/agent profiles operations"""
 
+    # Local skills directory listing: (directory mtime_ns, skill names).
+    # Services are created per request, so the cache lives on the class.
+    _local_skills_cache: Optional[Tuple[int, List[str]]] = None
+
     def __init__(self, db: Session):
         self.db = db
         # Path to local skills directory
@@ -22,17 +100,28 @@ class SkillService:
         """
         Get list of skills from local skills directory
 
+        The listing is cached until the directory's mtime changes (adding or
+        removing a skill directory updates it).
+
         Returns list of skill names (directory names)
         """
-        if not self.skills_dir.exists():
+        try:
+            mtime_ns = self.skills_dir.stat().st_mtime_ns
+        except FileNotFoundError:
             raise Exception(f"Skills directory not found: {self.skills_dir}")
 
-        skill_dirs = []
-        for item in self.skills_dir.iterdir():
-            if item.is_dir() and not item.name.startswith('.'):
-                skill_dirs.append(item.name)
+        cached = SkillService._local_skills_cache
+        if cached and cached[0] == mtime_ns:
+            return list(cached[1])
 
-        return skill_dirs
+        with os.scandir(self.skills_dir) as entries:
+            skill_dirs = [
+                entry.name for entry in entries
+                if entry.is_dir() and not entry.name.startswith('.')
+            ]
+
+        SkillService._local_skills_cache = (mtime_ns, skill_dirs)
+        return list(skill_dirs)
 
     def read_skill_markdown(self, skill_name: str) -> str:
         """
@@ -49,11 +138,7 @@ class SkillService:
         if not skill_file.exists():
             raise Exception(f"SKILL.md not found in {skill_name}/ directory")
 
-        try:
-            with open(skill_file, 'r', encoding='utf-8') as f:
-                return f.read()
-        except Exception as e:
-            raise Exception(f"Failed to read SKILL.md for {skill_name}: {str(e)}")
+        return skill_file.read_bytes().decode('utf-8')
 
     def parse_skill_markdown(self, markdown_content: str, skill_id: str) -> Dict[str, Any]:
         """
@@ -66,31 +151,27 @@ class SkillService:
         Returns:
             Dictionary with parsed skill data
         """
-        lines = markdown_content.strip().split('\n')
-
         # Extract title (first heading)
         title = skill_id.replace('-', ' ').title()
-        for line in lines:
-            if line.startswith('# '):
-                title = line[2:].strip()
-                break
-
-        # Extract description (first paragraph after title)
         description = None
-        in_content = False
-        for i, line in enumerate(lines):
-            if line.startswith('# '):
-                in_content = True
-                continue
-            if in_content and line.strip() and not line.startswith('#'):
-                description = line.strip()
-                break
+
+        title_match = _TITLE_RE.search(markdown_content)
+        if title_match:
+            title = title_match.group(1).strip()
+
+            # Extract description (first paragraph after title)
+            description_match = _DESCRIPTION_RE.search(markdown_content, title_match.end())
+            if description_match:
+                description = description_match.group(1).strip()
+
+        # Scan content once for every keyword used by category and tags
+        content_keywords = self._match_content_keywords(markdown_content)
 
         # Determine category based on skill name patterns
-        category = self._categorize_skill(skill_id, markdown_content)
+        category = self._categorize_skill(skill_id, content_keywords)
 
         # Extract tags from skill name and content
-        tags = self._extract_tags(skill_id, markdown_content)
+        tags = self._extract_tags(skill_id, content_keywords)
 
         return {
             'skill_id': skill_id,
@@ -101,17 +182,30 @@ class SkillService:
             'tags': tags
         }
 
-    def _categorize_skill(self, skill_id: str, content: str) -> str:
+    def _match_content_keywords(self, content: str) -> Set[str]:
         """
-        Categorize skill based on its name and content
+        Find which category/tag keywords appear in skill content
 
-        Returns category string like 'documentation', 'testing', 'design', etc.
+        Each distinct keyword is searched once and the result is shared by
+        _categorize_skill and _extract_tags.
         """
         content_lower = content.lower()
+        return {keyword for keyword in CONTENT_KEYWORDS if keyword in content_lower}
 
-        if 'doc' in skill_id or 'documentation' in content_lower:
+    def _categorize_skill(self, skill_id: str, content_keywords: Set[str]) -> str:
+        """
+        Categorize skill based on its name and content keywords
+
+        Returns category string like 'documentation', 'testing', 'design', etc.
+        """
+        # Known skills have a fixed category
+        category = SKILL_CATEGORY.get(skill_id)
+        if category:
+            return category
+
+        if 'doc' in skill_id or 'documentation' in content_keywords:
             return 'documentation'
-        elif 'test' in skill_id or 'testing' in content_lower:
+        elif 'test' in skill_id or 'testing' in content_keywords:
             return 'testing'
         elif 'design' in skill_id or 'frontend' in skill_id:
             return 'design'
@@ -121,67 +215,73 @@ class SkillService:
             return 'file-processing'
         elif 'web' in skill_id or 'webapp' in skill_id:
             return 'web-development'
-        elif 'comms' in skill_id or 'communication' in content_lower:
+        elif 'comms' in skill_id or 'communication' in content_keywords:
             return 'communication'
         else:
             return 'general'
 
-    def _extract_tags(self, skill_id: str, content: str) -> List[str]:
+    def _extract_tags(self, skill_id: str, content_keywords: Set[str]) -> List[str]:
         """
-        Extract relevant tags from skill ID and content
+        Extract relevant tags from skill ID and content keywords
 
         Returns list of tags for searchability
         """
-        tags = []
-
-        # Add skill name parts as tags
-        tags.extend(skill_id.split('-'))
-
-        # Add common keywords if found in content
-        keywords = ['documentation', 'testing', 'design', 'frontend', 'backend',
-                   'api', 'database', 'deployment', 'CI/CD', 'security', 'performance']
+        # Skill name parts, then common keywords found in content; dict.fromkeys
+        # drops duplicates while keeping that order stable across runs
+        return list(dict.fromkeys([
+            *skill_id.split('-'),
+            *(keyword for keyword in TAG_KEYWORDS if keyword in content_keywords)
+        ]))
+
+    def build_skill_row(self, skill_data: Dict[str, Any], source_url: str) -> Dict[str, Any]:
+        """
+        Build a skills table row from parsed skill data
 
-        content_lower = content.lower()
-        for keyword in keywords:
-            if keyword in content_lower:
-                tags.append(keyword)
+        Args:
+            skill_data: Parsed skill data dictionary
+            source_url: GitHub URL for the skill
 
-        # Remove duplicates and return
-        return list(set(tags))
+        Returns:
+            Column values for a single skill insert
+        """
+        return {
+            'skill_id': skill_data['skill_id'],
+            'title': skill_data['title'],
+            'description': skill_data['description'],
+            'content': skill_data['content'],
+            'category': skill_data['category'],
+            'tags': skill_data['tags'],
+            'source': 'anthropic',
+            'source_url': source_url
+        }
 
-    def ingest_skill(self, skill_data: Dict[str, Any], source_url: str) -> bool:
+    def insert_skills(self, rows: List[Dict[str, Any]]) -> Set[str]:
         """
-        Store a single skill in the database
+        Store skills in a single INSERT, skipping skill IDs that already exist
 
         Args:
-            skill_data: Parsed skill data dictionary
-            source_url: GitHub URL for the skill
+            rows: Skill rows from build_skill_row()
 
         Returns:
-            True if ingested successfully, False if skipped (already exists)
+            Set of skill IDs that were inserted
         """
+        if not rows:
+            return set()
+
         try:
-            skill = Skill(
-                skill_id=skill_data['skill_id'],
-                title=skill_data['title'],
-                description=skill_data['description'],
-                content=skill_data['content'],
-                category=skill_data['category'],
-                tags=skill_data['tags'],
-                source='anthropic',
-                source_url=source_url
-            )
+            stmt = insert(Skill).values(rows).on_conflict_do_nothing(
+                index_elements=['skill_id']
+            ).returning(Skill.skill_id)
 
-            self.db.add(skill)
+            inserted = {skill_id for skill_id, in self.db.execute(stmt)}
             self.db.commit()
-            self.db.refresh(skill)
 
-            return True
+            # New skills must show up in the pre-hook catalog right away
+            if inserted:
+                invalidate_skills_cache()
+
+            return inserted
 
-        except IntegrityError:
-            # Skill already exists (duplicate skill_id)
-            self.db.rollback()
-            return False
         except Exception as e:
             self.db.rollback()
             raise e
@@ -192,9 +292,9 @@ class SkillService:
 
         This orchestrates the full ingestion process:
         1. Get skill list from local skills/ directory
-        2. For each skill, read its markdown content
-        3. Parse the markdown
-        4. Store in database
+        2. Skip skills that are already stored (one batched lookup)
+        3. For each new skill, read and parse its markdown content
+        4. Store all parsed skills in the database in one statement
 
         Returns:
             IngestionResponse with statistics and details
@@ -207,8 +307,20 @@ class SkillService:
             # Get list of skills from local directory
             skill_names = self.get_local_skills()
 
-            # Process each skill
+            # Skills already in the database are skipped without reading them
+            existing = {
+                skill_id for skill_id, in self.db.query(Skill.skill_id).filter(
+                    Skill.skill_id.in_(skill_names)
+                )
+            }
+
+            # Read and parse each new skill
+            rows = []
+            failures = {}
             for skill_name in skill_names:
+                if skill_name in existing:
+                    continue
+
                 try:
                     # Read markdown content
                     markdown_content = self.read_skill_markdown(skill_name)
@@ -219,17 +331,27 @@ class SkillService:
                     # Generate source URL
                     source_url = f"https://github.com/anthropics/skills/tree/main/skills/{skill_name}"
 
-                    # Ingest skill
-                    if self.ingest_skill(skill_data, source_url):
-                        ingested_count += 1
-                        details.append(f"Ingested: {skill_name}")
-                    else:
-                        skipped_count += 1
-                        details.append(f"Skipped: {skill_name} (already exists)")
+                    rows.append(self.build_skill_row(skill_data, source_url))
 
                 except Exception as e:
-                    skipped_count += 1
-                    details.append(f"Failed: {skill_name} - {str(e)}")
+                    failures[skill_name] = str(e)
+
+            # Ingest all parsed skills at once
+            inserted = self.insert_skills(rows)
+
+            # Record (status, skill, note) per skill; strings are formatted once below
+            outcomes = [None] * len(skill_names)
+            for i, skill_name in enumerate(skill_names):
+                if skill_name in failures:
+                    outcomes[i] = ('Failed', skill_name, f" - {failures[skill_name]}")
+                elif skill_name in inserted:
+                    outcomes[i] = ('Ingested', skill_name, '')
+                else:
+                    outcomes[i] = ('Skipped', skill_name, ' (already exists)')
+
+            ingested_count = len(inserted)
+            skipped_count = len(skill_names) - ingested_count
+            details = [f"{status}: {name}{note}" for status, name, note in outcomes]
 
             return IngestionResponse(
                 status="success",
@@ -258,11 +380,9 @@ class SkillService:
 
     def get_all_skills(self, limit: int = 50) -> List[Dict[str, Any]]:
         """Retrieve all skills with optional limit"""
-        skills = self.db.query(Skill).order_by(
-            Skill.created_at.desc()
-        ).limit(limit).all()
-
-        return [skill.to_dict() for skill in skills]
+        return self.db.execute(
+            select(_skill_json()).order_by(Skill.created_at.desc()).limit(limit)
+        ).scalars().all()
 
     def search_skills(
         self,
@@ -283,29 +403,28 @@ class SkillService:
         Returns:
             List of matching skills
         """
-        query_obj = self.db.query(Skill)
+        stmt = select(_skill_json())
 
-        # Text search in title and description
+        # Text search in title and description (ILIKE is served by the
+        # pg_trgm GIN indexes from migration 013)
         if query:
-            query_obj = query_obj.filter(
+            stmt = stmt.where(
                 (Skill.title.ilike(f'%{query}%')) |
                 (Skill.description.ilike(f'%{query}%'))
             )
 
         # Filter by category
         if category:
-            query_obj = query_obj.filter(Skill.category == category)
+            stmt = stmt.where(Skill.category == category)
 
         # Filter by tag (check if tag exists in tags array)
         if tag:
-            query_obj = query_obj.filter(Skill.tags.any(tag))
+            stmt = stmt.where(Skill.tags.any(tag))
 
         # Order by most recent and limit
-        skills = query_obj.order_by(
-            Skill.created_at.desc()
-        ).limit(limit).all()
-
-        return [skill.to_dict() for skill in skills]
+        return self.db.execute(
+            stmt.order_by(Skill.created_at.desc()).limit(limit)
+        ).scalars().all()
 
     def manual_ingest_skill(self, skill_request: SkillIngestionRequest) -> Dict[str, Any]:
         """
@@ -333,6 +452,9 @@ class SkillService:
             self.db.commit()
             self.db.refresh(skill)
 
+            # New skills must show up in the pre-hook catalog right away
+            invalidate_skills_cache()
+
             return {
                 "status": "success",
                 "message": f"Skill {skill_request.skillId} ingested successfully",
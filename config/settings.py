@@ -1,13 +1,21 @@
 """
 Application settings and configuration
 """
-from pydantic_settings import BaseSettings
+from pydantic import Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
 from typing import Optional
 
 
 class Settings(BaseSettings):
     """Application settings loaded from environment variables"""
 
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_file_encoding="utf-8",
+        case_sensitive=True,
+        frozen=True
+    )
+
     # Application
     APP_NAME: str = "Context API"
     APP_VERSION: str = "1.0.0"
@@ -35,10 +43,8 @@ class Settings(BaseSettings):
     AI_SERVICE_URL: Optional[str] = None
     AI_API_KEY: Optional[str] = None
 
-    class Config:
-        env_file = ".env"
-        env_file_encoding = "utf-8"
-        case_sensitive = True
+    # AWS Bedrock (skill embeddings)
+    BEDROCK_MAX_REQUESTS_PER_MINUTE: int = Field(1000, gt=0)  # InvokeModel quota for the embedding model
 
 
 # Create global settings instance
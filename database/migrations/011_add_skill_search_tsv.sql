@@ -0,0 +1,29 @@
+-- Migration: Add full-text search column for skill suggestions
+-- Description: Moves keyword matching for POST /api/v1/skills/suggest into PostgreSQL
+--              using a stored tsvector column backed by a GIN index
+
+-- array_to_string() is only STABLE, so wrap it in an IMMUTABLE function that
+-- can be used inside a generated column expression
+CREATE OR REPLACE FUNCTION skills_tags_text(tags TEXT[])
+RETURNS TEXT
+LANGUAGE sql
+IMMUTABLE
+AS $$ SELECT array_to_string(COALESCE(tags, '{}'), ' ') $$;
+
+-- Stored tsvector over title, description and tags
+ALTER TABLE skills
+ADD COLUMN IF NOT EXISTS search_tsv TSVECTOR
+GENERATED ALWAYS AS (
+    to_tsvector('english',
+        COALESCE(title, '') || ' ' ||
+        COALESCE(description, '') || ' ' ||
+        skills_tags_text(tags))
+) STORED;
+
+-- GIN index for @@ tsquery matching
+CREATE INDEX IF NOT EXISTS idx_skills_search_tsv ON skills USING GIN (search_tsv);
+
+-- Superseded by idx_skills_search_tsv (title + description only)
+DROP INDEX IF EXISTS idx_skills_title_description;
+
+COMMENT ON COLUMN skills.search_tsv IS 'Full-text search vector over title, description and tags (generated)';
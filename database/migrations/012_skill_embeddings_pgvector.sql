@@ -0,0 +1,19 @@
+-- Migration: Store skill embeddings as pgvector with an ANN index
+-- Description: Semantic skill search runs as a single ORDER BY embedding <=> :query LIMIT k
+--              query instead of scanning every embedding in Python
+-- Requires: pgvector >= 0.5.0 (HNSW support)
+
+CREATE EXTENSION IF NOT EXISTS vector;
+
+-- GIN index on the JSONB array is not usable for similarity search
+DROP INDEX IF EXISTS idx_skills_embedding;
+
+-- Convert existing JSONB arrays ("[0.1, 0.2, ...]") to vector(1024)
+ALTER TABLE skills
+ALTER COLUMN embedding TYPE vector(1024) USING (embedding::text)::vector(1024);
+
+-- HNSW index for approximate nearest-neighbour search by cosine distance
+CREATE INDEX IF NOT EXISTS idx_skills_embedding_hnsw
+ON skills USING hnsw (embedding vector_cosine_ops);
+
+COMMENT ON COLUMN skills.embedding IS 'Vector embedding for semantic search (pgvector, 1024 dims from Bedrock Titan)';
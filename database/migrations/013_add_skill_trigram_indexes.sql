@@ -0,0 +1,14 @@
+-- Migration: Add trigram indexes for skill text search
+-- Description: Lets GET /api/skills/search?query=... (ILIKE '%query%' on title and
+--              description) use index scans instead of a sequential scan
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE INDEX IF NOT EXISTS idx_skills_title_trgm
+ON skills USING GIN (title gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS idx_skills_description_trgm
+ON skills USING GIN (description gin_trgm_ops);
+
+COMMENT ON INDEX idx_skills_title_trgm IS 'Optimizes ILIKE substring search on skill titles';
+COMMENT ON INDEX idx_skills_description_trgm IS 'Optimizes ILIKE substring search on skill descriptions';
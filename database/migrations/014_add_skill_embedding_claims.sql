@@ -0,0 +1,14 @@
+-- Migration: Add embedding claim lease to skills
+-- Description: Lets several scripts/generate_skill_embeddings.py workers run at once.
+--              A worker claims unembedded skills (FOR UPDATE SKIP LOCKED) by stamping
+--              embedding_claimed_at; claims older than the lease are picked up again
+
+ALTER TABLE skills ADD COLUMN IF NOT EXISTS embedding_claimed_at TIMESTAMP;
+
+-- Only skills still waiting for an embedding are ever scanned by the claim query
+CREATE INDEX IF NOT EXISTS idx_skills_embedding_pending
+ON skills (embedding_claimed_at)
+WHERE embedding IS NULL;
+
+COMMENT ON COLUMN skills.embedding_claimed_at IS 'When an embedding worker claimed this skill (NULL = unclaimed)';
+COMMENT ON INDEX idx_skills_embedding_pending IS 'Optimizes claiming skills that still need an embedding';
@@ -0,0 +1,15 @@
+-- Migration: Store skill embeddings as half-precision vectors
+-- Description: Halves embedding storage and I/O (2 bytes per dimension instead of 4) and
+--              shrinks the HNSW index accordingly; cosine ranking is unaffected in practice
+-- Requires: pgvector >= 0.7.0 (halfvec support)
+
+DROP INDEX IF EXISTS idx_skills_embedding_hnsw;
+
+ALTER TABLE skills
+ALTER COLUMN embedding TYPE halfvec(1024) USING embedding::halfvec(1024);
+
+-- HNSW index for approximate nearest-neighbour search by cosine distance
+CREATE INDEX IF NOT EXISTS idx_skills_embedding_hnsw
+ON skills USING hnsw (embedding halfvec_cosine_ops);
+
+COMMENT ON COLUMN skills.embedding IS 'Vector embedding for semantic search (pgvector halfvec, 1024 dims from Bedrock Titan)';
@@ -0,0 +1,17 @@
+-- Migration: Record which model and input text produced each skill embedding
+-- Description: scripts/generate_skill_embeddings.py regenerates an embedding only when it
+--              is missing, was produced by a different model, or the skill's
+--              title/description/tags text has changed since
+
+ALTER TABLE skills ADD COLUMN IF NOT EXISTS embedding_model_id VARCHAR(255);
+ALTER TABLE skills ADD COLUMN IF NOT EXISTS embedding_input_hash VARCHAR(32);
+
+-- Existing embeddings were all generated with Bedrock Titan v2 from the current text;
+-- record that so they are not regenerated on the next run
+UPDATE skills
+SET embedding_model_id = 'amazon.titan-embed-text-v2:0',
+    embedding_input_hash = md5(concat_ws(' ', title, nullif(description, ''), nullif(array_to_string(tags, ' '), '')))
+WHERE embedding IS NOT NULL AND embedding_model_id IS NULL;
+
+COMMENT ON COLUMN skills.embedding_model_id IS 'Bedrock model ID that produced the embedding';
+COMMENT ON COLUMN skills.embedding_input_hash IS 'MD5 of the title/description/tags text that was embedded';
@@ -0,0 +1,26 @@
+-- Migration: Store the embedding input text hash as a generated column
+-- Description: scripts/generate_skill_embeddings.py compares the hash recorded with each
+--              embedding against this column instead of recomputing md5() for every row
+--              on every claim, so pending skills are found through a partial index
+
+-- concat_ws()/array_to_string() are only STABLE, so wrap them in an IMMUTABLE function
+-- that can be used inside a generated column expression
+CREATE OR REPLACE FUNCTION skills_embedding_text(title TEXT, description TEXT, tags TEXT[])
+RETURNS TEXT
+LANGUAGE sql
+IMMUTABLE
+AS $$ SELECT concat_ws(' ', title, nullif(description, ''), nullif(array_to_string(tags, ' '), '')) $$;
+
+ALTER TABLE skills
+ADD COLUMN IF NOT EXISTS embedding_text_hash VARCHAR(32)
+GENERATED ALWAYS AS (md5(skills_embedding_text(title, description, tags))) STORED;
+
+-- Pending = no embedding yet, or embedded from text that has since changed
+-- (replaces the embedding IS NULL index from migration 014)
+DROP INDEX IF EXISTS idx_skills_embedding_pending;
+CREATE INDEX IF NOT EXISTS idx_skills_embedding_pending
+ON skills (embedding_claimed_at)
+WHERE embedding IS NULL OR embedding_input_hash IS DISTINCT FROM embedding_text_hash;
+
+COMMENT ON COLUMN skills.embedding_text_hash IS 'MD5 of the current title/description/tags embedding text (generated)';
+COMMENT ON INDEX idx_skills_embedding_pending IS 'Optimizes claiming skills whose embedding is missing or stale';
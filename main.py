@@ -1,8 +1,10 @@
 """
 Main FastAPI application entry point
 """
+import asyncio
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from contextlib import asynccontextmanager
 from config.settings import settings
 from config.database import check_db_connection, init_db
@@ -23,8 +25,8 @@ async def lifespan(app: FastAPI):
     # Startup
     logger.info(f"Starting {settings.APP_NAME} v{settings.APP_VERSION}")
 
-    # Check database connection
-    if check_db_connection():
+    # Check database connection (blocking I/O, kept off the event loop)
+    if await asyncio.to_thread(check_db_connection):
         logger.info("Database connection established")
     else:
         logger.error("Failed to connect to database")
@@ -32,7 +34,7 @@ async def lifespan(app: FastAPI):
     # Initialize database tables (in production, use migrations)
     if settings.DEBUG:
         try:
-            init_db()
+            await asyncio.to_thread(init_db)
         except Exception as e:
             logger.error(f"Database initialization failed: {e}")
 
@@ -67,6 +69,7 @@ app = FastAPI(
     """,
     docs_url="/docs",
     redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
@@ -4,87 +4,332 @@ Run this after adding new skills or to regenerate embeddings
 """
 import sys
 import os
+import argparse
+from collections import Counter
+from datetime import timedelta
 
 # Add parent directory to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from sqlalchemy.orm import Session
+from sqlalchemy import func, or_, select, true, update
 from config.database import SessionLocal
 from api.models.skill import Skill
-from api.services.embedding_service import EmbeddingService
+from api.services.embedding_service import (
+    EmbeddingService,
+    build_skill_text
+)
 import logging
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Concurrent Bedrock requests (the shared client is thread-safe)
+MAX_WORKERS = 32
 
-def generate_embeddings_for_all_skills(region_name: str = 'us-east-1'):
-    """Generate embeddings for all skills that don't have them"""
+# Skill texts handed to the embedding service per batch
+EMBEDDING_BATCH_SIZE = 96
 
-    # Create database session
-    db: Session = SessionLocal()
+# Embedding updates written and committed together
+COMMIT_BATCH_SIZE = 500
+
+# Claims older than this are treated as abandoned (worker crashed) and retried
+CLAIM_LEASE = timedelta(minutes=15)
+
+# Embeddings remembered per run, keyed by input text hash (oldest evicted first)
+EMBEDDING_CACHE_SIZE = 4096
+
+
+def needs_embedding():
+    """
+    SQL predicate for skills whose embedding is missing or stale
+
+    Stale means embedded from a title/description/tags text that has changed since
+    (embedding_text_hash is a generated column). Matches the partial index
+    idx_skills_embedding_pending from migration 017.
+    """
+    return or_(
+        Skill.embedding.is_(None),
+        Skill.embedding_input_hash.is_distinct_from(Skill.embedding_text_hash)
+    )
+
+
+def mark_other_model_stale(model_id: str) -> int:
+    """
+    Flag embeddings produced by a different model so they are regenerated
+
+    Clears their input hash (the old vector stays searchable until replaced),
+    which puts them under needs_embedding() without a per-claim model check.
+
+    Args:
+        model_id: Bedrock model the embeddings are generated with
+
+    Returns:
+        Number of skills flagged
+    """
+    with SessionLocal() as db:
+        result = db.execute(
+            update(Skill)
+            .where(
+                Skill.embedding.isnot(None),
+                Skill.embedding_input_hash.isnot(None),
+                Skill.embedding_model_id.is_distinct_from(model_id)
+            )
+            .values(embedding_input_hash=None, updated_at=Skill.updated_at)
+            .execution_options(synchronize_session=False)
+        )
+        db.commit()
+
+    return result.rowcount
+
+
+def in_shard(shard_index: int, shard_count: int):
+    """
+    SQL predicate selecting this worker's share of skills (by hash of skill_id)
+
+    Lets K instances (e.g. one per AWS region, each with its own Bedrock quota)
+    split the catalog without contending for the same rows.
+    """
+    if shard_count == 1:
+        return true()
+
+    # hashtext() can be negative; normalize the remainder into [0, shard_count)
+    bucket = func.mod(func.mod(func.hashtext(Skill.skill_id), shard_count) + shard_count, shard_count)
+    return bucket == shard_index
+
+
+def claim_skills(limit: int, shard_index: int = 0, shard_count: int = 1) -> list:
+    """
+    Atomically claim up to `limit` skills that need a (re)generated embedding
+
+    Rows locked by another worker are skipped (FOR UPDATE SKIP LOCKED) and the
+    claim is committed immediately, so concurrent runs never embed the same skill.
+    Uses its own short-lived session; no transaction stays open during Bedrock calls.
+
+    Args:
+        limit: Maximum number of skills to claim
+        shard_index: This worker's shard (0-based)
+        shard_count: Total number of shards
+
+    Returns:
+        Rows with id, skill_id, title, description, tags and embedding_text_hash
+    """
+    claimable = select(Skill.id).where(
+        needs_embedding(),
+        in_shard(shard_index, shard_count),
+        or_(
+            Skill.embedding_claimed_at.is_(None),
+            Skill.embedding_claimed_at < func.now() - CLAIM_LEASE
+        )
+    ).limit(limit).with_for_update(skip_locked=True)
+
+    with SessionLocal() as db:
+        rows = db.execute(
+            update(Skill)
+            .where(Skill.id.in_(claimable))
+            .values(embedding_claimed_at=func.now(), updated_at=Skill.updated_at)  # a claim is not a content change
+            .returning(
+                Skill.id,
+                Skill.skill_id,
+                Skill.title,
+                Skill.description,
+                Skill.tags,
+                Skill.embedding_text_hash
+            )
+            .execution_options(synchronize_session=False)
+        ).all()
+        db.commit()
+
+    return rows
+
+
+def release_claims(ids: list):
+    """
+    Clear the claim on skills this run could not embed
+
+    The lease only exists to recover from crashed workers; failures the worker
+    knows about are released so the next run retries them immediately.
+
+    Args:
+        ids: Skill primary keys to release
+    """
+    with SessionLocal() as db:
+        for start in range(0, len(ids), COMMIT_BATCH_SIZE):
+            db.execute(
+                update(Skill)
+                .where(Skill.id.in_(ids[start:start + COMMIT_BATCH_SIZE]))
+                .values(embedding_claimed_at=None, updated_at=Skill.updated_at)
+                .execution_options(synchronize_session=False)
+            )
+        db.commit()
+
+
+def store_embeddings(updates: list) -> bool:
+    """
+    Write a chunk of embeddings with one bulk UPDATE and commit it
+
+    A failed chunk is rolled back on its own; earlier chunks stay committed and
+    the caller releases the claims on the skills in it.
+    Uses its own short-lived session.
+
+    Args:
+        updates: {"id", "embedding", "embedding_model_id", "embedding_input_hash", ...} mappings
+
+    Returns:
+        True if the chunk was committed
+    """
+    with SessionLocal() as db:
+        try:
+            db.bulk_update_mappings(Skill, updates)
+            db.commit()
+            return True
+        except Exception as e:
+            db.rollback()
+            logger.error(f"Failed to store {len(updates)} embeddings (ids {updates[0]['id']}..{updates[-1]['id']}): {e}")
+            return False
+
+
+def generate_embeddings_for_all_skills(region_name: str = 'us-east-1', shard_index: int = 0, shard_count: int = 1):
+    """Generate embeddings for all skills (in this shard) that are missing one or whose embedding is stale"""
+
+    # Claims this run holds but could not complete; released before exiting so
+    # they are not hidden from the next run for the lease period
+    unfinished = []
 
     try:
         # Initialize embedding service
-        embedding_service = EmbeddingService(region_name=region_name)
+        embedding_service = EmbeddingService(region_name=region_name, batch=True)
+
+        # Fail fast on bad credentials/region/model access before claiming any skills;
+        # this also opens the first pooled connection to Bedrock
+        if not embedding_service.generate_embedding("warmup"):
+            raise RuntimeError(f"Bedrock model {embedding_service.model_id} is not reachable in {region_name}")
+
+        # Embeddings from another model are regenerated like changed texts
+        stale_count = mark_other_model_stale(embedding_service.model_id)
+        if stale_count:
+            logger.info(f"Marked {stale_count} embeddings from other models for regeneration")
+
+        # Skills with an up-to-date embedding are skipped in SQL
+        with SessionLocal() as db:
+            skip_count = db.query(func.count(Skill.id)).filter(
+                ~needs_embedding(),
+                in_shard(shard_index, shard_count)
+            ).scalar()
+        logger.info(f"Skipping {skip_count} skills - embedding already up to date")
 
-        # Get all skills
-        skills = db.query(Skill).all()
-        logger.info(f"Found {len(skills)} skills in database")
+        stats = Counter()
+        cache = {}
+        handled = set()
 
-        success_count = 0
-        skip_count = 0
-        error_count = 0
+        logger.info(f"Generating embeddings ({MAX_WORKERS} workers)")
 
-        for skill in skills:
-            # Skip if embedding already exists
-            if skill.embedding:
-                logger.info(f"Skipping {skill.skill_id} - embedding already exists")
-                skip_count += 1
+        # Claim, embed and store one chunk at a time until nothing is left to claim
+        while True:
+            claimed = claim_skills(COMMIT_BATCH_SIZE, shard_index, shard_count)
+            if not claimed:
+                break
+
+            # A skill is handled at most once per run; if it comes back (e.g. its text
+            # changed mid-run) it stays claimed until the run ends, then is released
+            unfinished.extend(skill.id for skill in claimed if skill.id in handled)
+            claimed = [skill for skill in claimed if skill.id not in handled]
+            handled.update(skill.id for skill in claimed)
+            if not claimed:
                 continue
 
-            logger.info(f"Generating embedding for: {skill.skill_id}")
+            # Cache key is the hash PostgreSQL computed for the row's current text
+            texts = [build_skill_text(skill.title, skill.description, skill.tags) for skill in claimed]
+            keys = [skill.embedding_text_hash for skill in claimed]
 
-            # Generate embedding
-            embedding = embedding_service.generate_skill_embedding(
-                skill.title,
-                skill.description or "",
-                skill.tags or []
-            )
+            # Identical texts (e.g. reseeded skills) are sent to Bedrock only once per run
+            missing = {key: text for key, text in zip(keys, texts) if key not in cache}
+            missing_keys = list(missing)
+            for start in range(0, len(missing_keys), EMBEDDING_BATCH_SIZE):
+                batch_keys = missing_keys[start:start + EMBEDDING_BATCH_SIZE]
 
-            if embedding:
-                # Store embedding as JSON array
-                skill.embedding = embedding
-                success_count += 1
-                logger.info(f"✓ Generated embedding for {skill.skill_id} ({len(embedding)} dimensions)")
-            else:
-                error_count += 1
-                logger.error(f"✗ Failed to generate embedding for {skill.skill_id}")
+                # Bedrock calls for the batch run concurrently; results come back in order
+                embeddings = embedding_service.generate_skill_embeddings_batch(
+                    [missing[key] for key in batch_keys],
+                    max_workers=MAX_WORKERS
+                )
 
-        # Commit changes
-        db.commit()
+                for key, embedding in zip(batch_keys, embeddings):
+                    if embedding:
+                        cache[key] = embedding
+
+            updates = []
+            failed = []
+            for skill, key in zip(claimed, keys):
+                embedding = cache.get(key)
+                if embedding:
+                    # Store embedding (pgvector column) and release the claim
+                    updates.append({
+                        "id": skill.id,
+                        "embedding": embedding,
+                        "embedding_model_id": embedding_service.model_id,
+                        # Exactly the value needs_embedding() compares against
+                        "embedding_input_hash": skill.embedding_text_hash,
+                        "embedding_claimed_at": None
+                    })
+                    logger.debug("✓ Generated embedding for %s (%d dimensions)", skill.skill_id, len(embedding))
+                else:
+                    # Kept claimed (so this run doesn't pick it up again) until the run ends
+                    failed.append(skill.id)
+                    logger.error("✗ Failed to generate embedding for %s", skill.skill_id)
+
+            # Evict the oldest entries once this chunk has been resolved
+            while len(cache) > EMBEDDING_CACHE_SIZE:
+                del cache[next(iter(cache))]
+
+            # Commit per claimed chunk so a failure only loses that chunk
+            stored = len(updates) if updates and store_embeddings(updates) else 0
+            if updates and not stored:
+                failed.extend(mapping["id"] for mapping in updates)
+            unfinished.extend(failed)
+
+            # Counts are updated and reported once per chunk (per-skill messages are DEBUG)
+            stats.update(processed=len(claimed), success=stored, error=len(claimed) - stored)
+            logger.info("Processed %d skills (%d embedded, %d errors)", stats["processed"], stats["success"], stats["error"])
 
         logger.info(f"""
         ========================================
         Embedding Generation Complete
         ========================================
-        Total skills: {len(skills)}
-        Success: {success_count}
-        Skipped (already have embeddings): {skip_count}
-        Errors: {error_count}
+        Total skills: {skip_count + stats['processed']}
+        Success: {stats['success']}
+        Skipped (embedding up to date): {skip_count}
+        Errors: {stats['error']} (claims released for the next run)
         ========================================
         """)
 
     except Exception as e:
         logger.error(f"Error generating embeddings: {e}")
-        db.rollback()
     finally:
-        db.close()
+        if unfinished:
+            try:
+                release_claims(unfinished)
+                logger.info(f"Released claims on {len(unfinished)} skills for retry")
+            except Exception as e:
+                logger.error(f"Failed to release claims on {len(unfinished)} skills (lease expires in {CLAIM_LEASE}): {e}")
 
 
 if __name__ == "__main__":
-    # You can pass AWS region as argument
-    region = sys.argv[1] if len(sys.argv) > 1 else 'us-east-1'
-    logger.info(f"Using AWS region: {region}")
+    parser = argparse.ArgumentParser(description="Generate Bedrock embeddings for skills")
+    # AWS region can also be passed positionally (original usage)
+    parser.add_argument("region_arg", nargs="?", metavar="region", help=argparse.SUPPRESS)
+    parser.add_argument("--region", default=None, help="AWS region for Bedrock (default: us-east-1)")
+    parser.add_argument("--shard-index", type=int, default=0, help="This instance's shard, 0-based (default: 0)")
+    parser.add_argument("--shard-count", type=int, default=1, help="Total number of shards/instances (default: 1)")
+    args = parser.parse_args()
+
+    if args.shard_count < 1 or not 0 <= args.shard_index < args.shard_count:
+        parser.error("--shard-index must be in [0, --shard-count)")
+
+    region = args.region or args.region_arg or 'us-east-1'
+    logger.info(f"Using AWS region: {region} (shard {args.shard_index + 1}/{args.shard_count})")
 
-    generate_embeddings_for_all_skills(region_name=region)
+    generate_embeddings_for_all_skills(
+        region_name=region,
+        shard_index=args.shard_index,
+        shard_count=args.shard_count
+    )